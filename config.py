@@ -2,58 +2,118 @@
 Configuration management for Reddit Persona Analyzer
 """
 
+import functools
 import os
+from dataclasses import dataclass
 from typing import Dict, Optional
-from dotenv import load_dotenv
+
+def _ensure_env_loaded() -> None:
+    """Load the .env file only when the environment is not already populated"""
+    required = ('REDDIT_CLIENT_ID', 'REDDIT_CLIENT_SECRET', 'OPENROUTER_API_KEY')
+    if not all(key in os.environ for key in required):
+        from dotenv import load_dotenv
+        load_dotenv(override=False)
 
 # Load environment variables from .env file
-load_dotenv()
+_ensure_env_loaded()
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable snapshot of all environment-derived settings"""
+
+    reddit_client_id: Optional[str]
+    reddit_client_secret: Optional[str]
+    reddit_user_agent: str
+    openrouter_api_key: Optional[str]
+    ai_api_url: str
+    max_posts: int
+    max_comments: int
+    output_dir: str
+
+class _ConfigMeta(type):
+    """Expose the cached snapshot fields as Config's class-level attributes"""
+
+    @property
+    def REDDIT_CLIENT_ID(cls) -> Optional[str]:
+        return cls._snapshot().reddit_client_id
+
+    @property
+    def REDDIT_CLIENT_SECRET(cls) -> Optional[str]:
+        return cls._snapshot().reddit_client_secret
+
+    @property
+    def REDDIT_USER_AGENT(cls) -> str:
+        return cls._snapshot().reddit_user_agent
+
+    @property
+    def OPENROUTER_API_KEY(cls) -> Optional[str]:
+        return cls._snapshot().openrouter_api_key
+
+    @property
+    def AI_API_URL(cls) -> str:
+        return cls._snapshot().ai_api_url
 
-class Config:
+    @property
+    def MAX_POSTS(cls) -> int:
+        return cls._snapshot().max_posts
+
+    @property
+    def MAX_COMMENTS(cls) -> int:
+        return cls._snapshot().max_comments
+
+    @property
+    def OUTPUT_DIR(cls) -> str:
+        return cls._snapshot().output_dir
+
+class Config(metaclass=_ConfigMeta):
     """Configuration class for managing API keys and settings"""
-    
-    # Reddit API Configuration
-    REDDIT_CLIENT_ID: Optional[str] = os.getenv('REDDIT_CLIENT_ID')
-    REDDIT_CLIENT_SECRET: Optional[str] = os.getenv('REDDIT_CLIENT_SECRET')
-    REDDIT_USER_AGENT: str = os.getenv('REDDIT_USER_AGENT', 'RedditPersonaAnalyzer/1.0')
-    
-    # AI API Configuration
-    OPENROUTER_API_KEY: Optional[str] = os.getenv('OPENROUTER_API_KEY')
-    AI_API_URL: str = os.getenv('AI_API_URL', 'https://openrouter.ai/api/v1/chat/completions')
-    
-    # Application Settings
-    MAX_POSTS: int = int(os.getenv('MAX_POSTS', '50'))
-    MAX_COMMENTS: int = int(os.getenv('MAX_COMMENTS', '50'))
-    OUTPUT_DIR: str = os.getenv('OUTPUT_DIR', 'output')
-    
+
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _snapshot(cls) -> ConfigSnapshot:
+        """Read and parse the environment once, then serve the cached result"""
+        return ConfigSnapshot(
+            reddit_client_id=os.getenv('REDDIT_CLIENT_ID'),
+            reddit_client_secret=os.getenv('REDDIT_CLIENT_SECRET'),
+            reddit_user_agent=os.getenv('REDDIT_USER_AGENT', 'RedditPersonaAnalyzer/1.0'),
+            openrouter_api_key=os.getenv('OPENROUTER_API_KEY'),
+            ai_api_url=os.getenv('AI_API_URL', 'https://openrouter.ai/api/v1/chat/completions'),
+            max_posts=int(os.getenv('MAX_POSTS', '50')),
+            max_comments=int(os.getenv('MAX_COMMENTS', '50')),
+            output_dir=os.getenv('OUTPUT_DIR', 'output')
+        )
+
     @classmethod
     def validate(cls) -> bool:
         """Validate that all required configuration is present"""
-        required_vars = [
-            ('REDDIT_CLIENT_ID', cls.REDDIT_CLIENT_ID),
-            ('REDDIT_CLIENT_SECRET', cls.REDDIT_CLIENT_SECRET),
-            ('OPENROUTER_API_KEY', cls.OPENROUTER_API_KEY)
-        ]
-        missing = [name for name, value in required_vars if not value]
-        if missing:
-            print(f"❌ Missing required environment variables: {', '.join(missing)}")
-            print("Please check your .env file and ensure all required variables are set.")
-            return False
-        return True
-    
+        snapshot = cls._snapshot()
+        # Happy path: no list construction when everything is present.
+        if snapshot.reddit_client_id and snapshot.reddit_client_secret and snapshot.openrouter_api_key:
+            return True
+        missing = [name for name, value in (
+            ('REDDIT_CLIENT_ID', snapshot.reddit_client_id),
+            ('REDDIT_CLIENT_SECRET', snapshot.reddit_client_secret),
+            ('OPENROUTER_API_KEY', snapshot.openrouter_api_key)
+        ) if not value]
+        print(f"❌ Missing required environment variables: {', '.join(missing)}")
+        print("Please check your .env file and ensure all required variables are set.")
+        return False
+
     @classmethod
     def get_reddit_config(cls) -> Dict[str, str]:
         """Get Reddit API configuration"""
+        snapshot = cls._snapshot()
         return {
-            'client_id': cls.REDDIT_CLIENT_ID,
-            'client_secret': cls.REDDIT_CLIENT_SECRET,
-            'user_agent': cls.REDDIT_USER_AGENT
+            'client_id': snapshot.reddit_client_id,
+            'client_secret': snapshot.reddit_client_secret,
+            'user_agent': snapshot.reddit_user_agent
         }
-    
+
     @classmethod
     def get_ai_config(cls) -> Dict[str, str]:
         """Get AI API configuration"""
+        snapshot = cls._snapshot()
         return {
-            'api_key': cls.OPENROUTER_API_KEY,
-            'api_url': cls.AI_API_URL
+            'api_key': snapshot.openrouter_api_key,
+            'api_url': snapshot.ai_api_url
         }
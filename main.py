@@ -1,15 +1,19 @@
+import functools
+import gzip
 import os
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Tuple
 from dataclasses import dataclass
-import praw
+import orjson
 import requests
-from urllib.parse import urlparse
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from config import _ensure_env_loaded
 
 # Load environment variables
-load_dotenv()
+_ensure_env_loaded()
 
 # Configure logging
 logging.basicConfig(
@@ -18,7 +22,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+_USER_RE = re.compile(r'^https?://[^/]+/u(?:ser)?/([^/?#]+)', re.I)
+
+# Store no more body text than the prompt will ever use (500/300 chars),
+# with some headroom; full selftexts can run to many KB each.
+MAX_BODY_CHARS = 1024
+
+_POST_TMPL = "\nPOST {i}:\nSubreddit: r/{sub}\nTitle: {title}\nContent: {body}\nScore: {score}\nLink: {link}\n"
+_COMMENT_TMPL = "\nCOMMENT {i}:\nSubreddit: r/{sub}\nContent: {body}\nScore: {score}\nLink: {link}\n"
+
+_PERSONA_PROMPT = """
+        Analyze the following Reddit user's posts and comments to create a detailed user persona.
+        For the user '{username}', provide a comprehensive analysis including:
+        1. PERSONALITY TRAITS
+        2. INTERESTS AND HOBBIES
+        3. WRITING STYLE
+        4. POSSIBLE DEMOGRAPHICS
+        5. BEHAVIORAL PATTERNS
+        6. VALUES AND BELIEFS
+        IMPORTANT: For EACH characteristic you identify, cite the specific post or comment that supports this conclusion.
+        {content}
+        """
+
+@dataclass(slots=True, frozen=True)
 class RedditContent:
     content_type: str
     title: str
@@ -31,50 +57,71 @@ class RedditContent:
 
 class RedditScraper:
     def __init__(self, client_id: str, client_secret: str, user_agent: str):
+        # praw is heavy to import; defer it so config-validation and help
+        # paths that never scrape don't pay for it at startup.
+        import praw
         self.reddit = praw.Reddit(
             client_id=client_id,
             client_secret=client_secret,
             user_agent=user_agent
         )
 
-    def extract_username(self, url_or_username: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def extract_username(url_or_username: str) -> str:
         if url_or_username.startswith('http'):
-            parsed = urlparse(url_or_username)
-            path_parts = parsed.path.strip('/').split('/')
-            if 'user' in path_parts:
-                username_index = path_parts.index('user') + 1
-                return path_parts[username_index]
+            match = _USER_RE.match(url_or_username)
+            if match:
+                return match.group(1)
             raise ValueError(f"Could not extract username from URL: {url_or_username}")
         else:
             return url_or_username.replace('u/', '').replace('/u/', '')
 
-    def scrape_user_data(self, username: str, max_posts: int = 50, max_comments: int = 50) -> Tuple[List[RedditContent], List[RedditContent]]:
-        user = self.reddit.redditor(username)
+    def _fetch_posts(self, user, limit: int) -> List[RedditContent]:
         posts = []
-        comments = []
-        logger.info(f"Scraping user: {username}")
-        for submission in user.submissions.new(limit=max_posts):
+        # Reddit listings page in batches of 100; capping the limit keeps
+        # each fetch to a single round trip.
+        for submission in user.submissions.new(limit=min(limit, 100)):
             posts.append(RedditContent(
                 content_type='post',
                 title=submission.title,
-                body=submission.selftext,
+                body=submission.selftext[:MAX_BODY_CHARS],
                 score=submission.score,
                 created_utc=submission.created_utc,
                 subreddit=str(submission.subreddit),
                 url=submission.url,
                 permalink=f"https://reddit.com{submission.permalink}"
             ))
-        for comment in user.comments.new(limit=max_comments):
+        return posts
+
+    def _fetch_comments(self, user, limit: int) -> List[RedditContent]:
+        comments = []
+        for comment in user.comments.new(limit=min(limit, 100)):
+            # Resolve the lazy subreddit attribute once per comment; it is
+            # needed both for the title and the subreddit field.
+            sub = str(comment.subreddit)
             comments.append(RedditContent(
                 content_type='comment',
-                title=f"Comment in r/{comment.subreddit}",
-                body=comment.body,
+                title=f"Comment in r/{sub}",
+                body=comment.body[:MAX_BODY_CHARS],
                 score=comment.score,
                 created_utc=comment.created_utc,
-                subreddit=str(comment.subreddit),
+                subreddit=sub,
                 url="",
                 permalink=f"https://reddit.com{comment.permalink}"
             ))
+        return comments
+
+    def scrape_user_data(self, username: str, max_posts: int = 50, max_comments: int = 50) -> Tuple[List[RedditContent], List[RedditContent]]:
+        user = self.reddit.redditor(username)
+        logger.info(f"Scraping user: {username}")
+        # The two listings are independent network streams, so fetch them
+        # concurrently instead of waiting on one before starting the other.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            posts_future = executor.submit(self._fetch_posts, user, max_posts)
+            comments_future = executor.submit(self._fetch_comments, user, max_comments)
+            posts = posts_future.result()
+            comments = comments_future.result()
         return posts, comments
 
 class PersonaAnalyzer:
@@ -82,30 +129,33 @@ class PersonaAnalyzer:
         self.api_key = api_key
         self.api_url = "https://openrouter.ai/api/v1/chat/completions"
         self.model = "deepseek/deepseek-chat-v3-0324"
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        # Pooled session keeps the TLS connection warm across calls. No
+        # automatic retries: the LLM POST is not idempotent and a blind
+        # retry would double-spend tokens.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
 
     def prepare_content(self, posts: List[RedditContent], comments: List[RedditContent]) -> str:
-        content = "REDDIT USER CONTENT FOR ANALYSIS:\n\n"
-        content += "=== POSTS ===\n"
-        for i, post in enumerate(posts[:25], 1):
-            content += f"\nPOST {i}:\nSubreddit: r/{post.subreddit}\nTitle: {post.title}\nContent: {post.body[:500]}\nScore: {post.score}\nLink: {post.permalink}\n"
-        content += "\n=== COMMENTS ===\n"
-        for i, comment in enumerate(comments[:25], 1):
-            content += f"\nCOMMENT {i}:\nSubreddit: r/{comment.subreddit}\nContent: {comment.body[:300]}\nScore: {comment.score}\nLink: {comment.permalink}\n"
-        return content
+        # Build with list.append + join; += on a str copies the whole buffer each time.
+        parts = ["REDDIT USER CONTENT FOR ANALYSIS:\n\n", "=== POSTS ===\n"]
+        parts.extend(
+            _POST_TMPL.format(i=i, sub=p.subreddit, title=p.title, body=p.body[:500], score=p.score, link=p.permalink)
+            for i, p in enumerate(posts[:25], 1)
+        )
+        parts.append("\n=== COMMENTS ===\n")
+        parts.extend(
+            _COMMENT_TMPL.format(i=i, sub=c.subreddit, body=c.body[:300], score=c.score, link=c.permalink)
+            for i, c in enumerate(comments[:25], 1)
+        )
+        return "".join(parts)
 
     def analyze_persona(self, username: str, content: str) -> str:
-        prompt = f"""
-        Analyze the following Reddit user's posts and comments to create a detailed user persona. 
-        For the user '{username}', provide a comprehensive analysis including:
-        1. PERSONALITY TRAITS
-        2. INTERESTS AND HOBBIES
-        3. WRITING STYLE
-        4. POSSIBLE DEMOGRAPHICS
-        5. BEHAVIORAL PATTERNS
-        6. VALUES AND BELIEFS
-        IMPORTANT: For EACH characteristic you identify, cite the specific post or comment that supports this conclusion.
-        {content}
-        """
+        prompt = _PERSONA_PROMPT.format(username=username, content=content)
         payload = {
             "model": self.model,
             "messages": [
@@ -113,26 +163,57 @@ class PersonaAnalyzer:
                 {"role": "user", "content": prompt}
             ],
             "temperature": 0.7,
-            "max_tokens": 4000
+            "max_tokens": 4000,
+            "stream": True
         }
-        response = requests.post(self.api_url, headers={
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }, json=payload)
+        # orjson encodes straight to bytes, several times faster than the
+        # stdlib encoder requests uses for json=. Level-1 gzip then cuts
+        # the multi-KB prompt body 3-5x for negligible CPU.
+        body = gzip.compress(orjson.dumps(payload), compresslevel=1)
+        response = self.session.post(self.api_url, data=body, headers={'Content-Encoding': 'gzip'}, stream=True, timeout=(5, 120))
         if response.status_code != 200:
             logger.error(f"API error {response.status_code}: {response.text}")
             raise Exception(f"API error {response.status_code}: {response.text}")
-        return response.json()['choices'][0]['message']['content']
-
-def main():
-    # Load API credentials from environment variables
+        # Consume the SSE stream incrementally instead of buffering the
+        # full completion body before decoding it.
+        chunks = []
+        for line in response.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data: "):
+                continue
+            data = line[len("data: "):]
+            if data == "[DONE]":
+                break
+            frame = orjson.loads(data)
+            if frame.get('error'):
+                logger.error(f"API error in stream: {frame['error']}")
+                raise Exception(f"API error in stream: {frame['error']}")
+            choices = frame.get('choices')
+            if not choices:
+                continue
+            content = choices[0].get('delta', {}).get('content')
+            if content:
+                chunks.append(content)
+        result = "".join(chunks)
+        if not result:
+            logger.error("API returned no streamed content")
+            raise Exception("API returned no streamed content")
+        return result
+
+@functools.lru_cache(maxsize=1)
+def load_config() -> Tuple[dict, str]:
+    """Parse API credentials from the environment once and cache the result"""
     reddit_config = {
         'client_id': os.getenv('REDDIT_CLIENT_ID', ''),
         'client_secret': os.getenv('REDDIT_CLIENT_SECRET', ''),
         'user_agent': os.getenv('REDDIT_USER_AGENT', 'python:com.adityajadhav.myredditbot:v0.1 (by u/adityajadhav)')
     }
     api_key = os.getenv('OPENROUTER_API_KEY', '')
-    
+    return reddit_config, api_key
+
+def main():
+    # Load API credentials from environment variables
+    reddit_config, api_key = load_config()
+
     # Validate that API keys are set
     if not reddit_config['client_id'] or not reddit_config['client_secret'] or not api_key:
         print("❌ Error: API credentials not found!")